@@ -43,10 +43,19 @@ GUI_TYPE_MOBILE: int = 1
 # Tools
 SCREENSHOTER_INPUT_FILE: str = "data/screenshots/ALEXA_500/urls.csv"
 SCREENSHOTER_OUTPUT_DIR: str = "data/screenshots/results/"
+SCREENSHOTER_WORKERS: int = 1
 EVALUATOR_INPUT_DIR: str = "data/screenshots/ALEXA_500/"
 EVALUATOR_EXCLUDE_FILENAME: str = "exclude.txt"
 EVALUATOR_OUTPUT_DIR: str = "data/evaluations/results/"
 
+# Database
+DATABASE_MAX_POOL_SIZE: int = 20
+DATABASE_MIN_POOL_SIZE: int = 4
+DATABASE_SERVER_SELECTION_TIMEOUT_MS: int = 3000
+DATABASE_WAIT_QUEUE_TIMEOUT_MS: int = 2000
+DATABASE_ERRORS_BATCH_SIZE: int = 100
+DATABASE_ERRORS_FLUSH_INTERVAL: float = 1.0  # seconds
+
 # Web application
 ALLOWED_HOSTS: List[str] = [
     "localhost",
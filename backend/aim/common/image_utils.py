@@ -16,6 +16,7 @@ import pathlib
 from io import BytesIO
 
 # Third-party modules
+import cv2
 import numpy as np
 from PIL import Image
 from resizeimage import resizeimage
@@ -35,9 +36,9 @@ from aim.exceptions import ValidationError
 # ----------------------------------------------------------------------------
 
 __author__ = "Markku Laine"
-__date__ = "2021-12-13"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "1.2"
+__version__ = "1.3"
 
 
 # ----------------------------------------------------------------------------
@@ -179,6 +180,36 @@ def to_png_image_base64(
     return png_image_base64
 
 
+def data_to_png_image_base64(
+    image_data: np.ndarray,
+    png_image_compress_level: int = IMAGE_COMPRESS_LEVEL_PNG,
+) -> str:
+    """
+    Convert RGB image data to a PNG image encoded in Base64.
+
+    The image data is encoded directly with OpenCV, without creating an
+    intermediate PIL image.
+
+    Args:
+        image_data: RGB image data (uint8) as Numpy array
+
+    Kwargs:
+        png_image_compress_level: PNG image compress level (defaults to 6)
+
+    Returns:
+        PNG image encoded in Base64
+    """
+    buffer: np.ndarray
+    _, buffer = cv2.imencode(
+        ".png",
+        cv2.cvtColor(image_data, cv2.COLOR_RGB2BGR),  # OpenCV expects BGR
+        [cv2.IMWRITE_PNG_COMPRESSION, png_image_compress_level],
+    )  # [0, 9], where 0 = no compression and 9 = best compression
+    png_image_base64: str = base64.b64encode(buffer).decode("utf-8")
+
+    return png_image_base64
+
+
 def to_jpeg_image_base64(
     pil_image: Image.Image, jpeg_image_quality: int = IMAGE_QUALITY_JPEG
 ) -> str:
@@ -220,13 +251,14 @@ def base64_to_data(
     Returns:
         Image data as Numpy array
     """
-    # Create a PIL image
-    pil_image: Image.Image = Image.open(
-        BytesIO(base64.b64decode(image_base64))
-    ).convert("RGB")
-
-    # Convert to numpy array
-    image_data: np.ndarray = np.array(pil_image, dtype=np.uint8)
+    # Decode to BGR image data and convert to RGB
+    image_data: np.ndarray = cv2.cvtColor(
+        cv2.imdecode(
+            np.frombuffer(base64.b64decode(image_base64), dtype=np.uint8),
+            cv2.IMREAD_COLOR,
+        ),
+        cv2.COLOR_BGR2RGB,
+    )
 
     return image_data
 
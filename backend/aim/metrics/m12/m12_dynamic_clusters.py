@@ -41,6 +41,10 @@ References:
 
 
 Change log:
+    v2.1 (2026-10-14)
+      * Store clusters as NumPy columns and compute distances to all
+        clusters at once
+
     v2.0 (2022-06-09)
       * Revised implementation
 
@@ -54,16 +58,14 @@ Change log:
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import base64
-from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Union
 
 # Third-party modules
 import numpy as np
-from PIL import Image
 from pydantic import HttpUrl
 
 # First-party modules
+from aim.common import image_utils
 from aim.common.constants import GUI_TYPE_DESKTOP, GUI_TYPE_MOBILE
 from aim.metrics.interfaces import AIMMetricInterface
 
@@ -72,9 +74,9 @@ from aim.metrics.interfaces import AIMMetricInterface
 # ----------------------------------------------------------------------------
 
 __author__ = "Amir Hossein Kargaran, Markku Laine, Thomas Langerak, Yuxi Zhu"
-__date__ = "2022-06-09"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "2.0"
+__version__ = "2.1"
 
 
 # ----------------------------------------------------------------------------
@@ -102,20 +104,23 @@ class Metric(AIMMetricInterface):
     @classmethod
     def get_dynamic_clusters(
         cls,
-        img_rgb: Image.Image,
+        img_rgb: np.ndarray,
         gui_type: int = GUI_TYPE_DESKTOP,
-    ) -> List:
+    ) -> Dict[str, np.ndarray]:
         """
         Get dynamic clusters of the input image.
 
         Args:
-            img_rgb: input RGB image
+            img_rgb: input RGB image array (height x width x 3, uint8)
 
         Kwargs:
             gui_type: GUI type, desktop = 0 (default), mobile = 1
 
         Returns:
-            List of computed dynamic clusters
+            Computed dynamic clusters as parallel arrays
+            - centers: cluster center RGB values (int64, K x 3)
+            - pixel_counts: number of pixels in each cluster (int64, K)
+            - color_counts: number of colors united in each cluster (int64, K)
         """
         # Set color reduction threshold
         color_reduction_threshold: int = (
@@ -124,122 +129,98 @@ class Metric(AIMMetricInterface):
             else cls._COLOR_REDUCTION_THRESHOLD_DESKTOP
         )
 
-        # Calculate total number of image pixels
-        total_pixels: int = img_rgb.width * img_rgb.height
-
-        # Get RGB color histogram
-        rgb_color_histogram: List[Tuple[int, Tuple]] = img_rgb.getcolors(
-            maxcolors=total_pixels
+        # Get RGB color histogram, packing each pixel into a single integer
+        img_packed: np.ndarray = (
+            (img_rgb[:, :, 0].astype(np.uint32) << 16)
+            | (img_rgb[:, :, 1].astype(np.uint32) << 8)
+            | img_rgb[:, :, 2]
         )
-        frequency: List = []
-
-        # Create list from histogram
-        for h in list(rgb_color_histogram):
-            h_count, h_rgb = h
-            rc, gc, bc = h_rgb
-            add: List = [rc, gc, bc, h_count]
-            frequency.append(add)
+        colors: np.ndarray
+        color_pixel_counts: np.ndarray
+        colors, color_pixel_counts = np.unique(img_packed, return_counts=True)
 
         # Only color points with enough presence
-        frequency = list(
-            filter(lambda e: e[3] > color_reduction_threshold, frequency)
+        enough_presence: np.ndarray = (
+            color_pixel_counts > color_reduction_threshold
         )
+        colors = colors[enough_presence].astype(np.int64)
+        color_pixel_counts = color_pixel_counts[enough_presence].astype(
+            np.int64
+        )
+        frequency_rgb: np.ndarray = np.column_stack(
+            [(colors >> 16) & 0xFF, (colors >> 8) & 0xFF, colors & 0xFF]
+        )
+
         # Sort the pixels on frequency; this way we can cut the while loop short.
         # Note: Order of proccesing the clusters may change the result.
         # The paper does not contain any recommendations. Here the order is fixed as follows:
-        frequency = sorted(frequency, key=lambda e: (e[3], e[2], e[1], e[0]))
+        order: np.ndarray = np.lexsort(
+            (
+                frequency_rgb[:, 0],
+                frequency_rgb[:, 1],
+                frequency_rgb[:, 2],
+                color_pixel_counts,
+            )
+        )
+        frequency_rgb = frequency_rgb[order]
+        color_pixel_counts = color_pixel_counts[order]
+
+        # Cluster columns, preallocated for the worst case of one cluster
+        # per color point
+        n_points: int = len(color_pixel_counts)
+        centers: np.ndarray = np.empty((n_points, 3), dtype=np.int64)
+        pixel_counts: np.ndarray = np.empty(n_points, dtype=np.int64)
+        color_counts: np.ndarray = np.empty(n_points, dtype=np.int64)
 
         # Create first cluster
-        center_of_clusters: List = []
-        add = [
-            frequency[0][0],
-            frequency[0][1],
-            frequency[0][2],
-            frequency[0][3],
-            1,
-        ]
-        center_of_clusters.append(add)
+        centers[0] = frequency_rgb[0]
+        pixel_counts[0] = color_pixel_counts[0]
+        color_counts[0] = 1
+        n_clusters: int = 1
 
         # Find for all color points of a cluster
-        for k in range(len(frequency) - 1, -1, -1):
-            belong1cluster: bool = False
-
-            # For every color point calculate distance to all clusters
-            for center in range(len(center_of_clusters)):
-                point_freq: np.ndarray = np.array(
-                    [frequency[k][0], frequency[k][1], frequency[k][2]]
-                )
-                point_center: np.ndarray = np.array(
-                    [
-                        center_of_clusters[center][0],
-                        center_of_clusters[center][1],
-                        center_of_clusters[center][2],
-                    ]
-                )
-
-                # If a cluster is close enough, add this color and recalculate the cluster. Now the color goes to
-                # the first cluster fulfilling this. There is no indication in the paper that it should be the first
-                # cluster meeting the requirement or the closest cluster.
-                distance: float = float(
-                    np.linalg.norm(point_freq - point_center)
-                )
-                if distance <= cls._DISTANCE_THRESHOLD:
-                    new_count: int = int(
-                        center_of_clusters[center][3] + frequency[k][3]
-                    )
-                    new_center: List[int] = [
-                        int(
-                            (
-                                point_freq[0] * frequency[k][3]
-                                + point_center[0]
-                                * center_of_clusters[center][3]
-                            )
-                            / new_count
-                        ),
-                        int(
-                            (
-                                point_freq[1] * frequency[k][3]
-                                + point_center[1]
-                                * center_of_clusters[center][3]
-                            )
-                            / new_count
-                        ),
-                        int(
-                            (
-                                point_freq[2] * frequency[k][3]
-                                + point_center[2]
-                                * center_of_clusters[center][3]
-                            )
-                            / new_count
-                        ),
-                    ]
-
-                    center_of_clusters[center][0] = new_center[0]
-                    center_of_clusters[center][1] = new_center[1]
-                    center_of_clusters[center][2] = new_center[2]
-                    center_of_clusters[center][3] = new_count
-                    center_of_clusters[center][4] += 1
-                    belong1cluster = True
-                    break
+        distance_threshold_sq: int = cls._DISTANCE_THRESHOLD**2
+        for k in range(n_points - 1, -1, -1):
+            point_freq: np.ndarray = frequency_rgb[k]
+            point_count: int = int(color_pixel_counts[k])
+
+            # For every color point calculate (squared) distance to all
+            # clusters at once
+            distances_sq: np.ndarray = np.square(
+                centers[:n_clusters] - point_freq
+            ).sum(axis=1)
+            close_enough: np.ndarray = distances_sq <= distance_threshold_sq
+
+            # If a cluster is close enough, add this color and recalculate the cluster. Now the color goes to
+            # the first cluster fulfilling this. There is no indication in the paper that it should be the first
+            # cluster meeting the requirement or the closest cluster.
+            center: int = int(np.argmax(close_enough))
+            if close_enough[center]:
+                new_count: int = int(pixel_counts[center]) + point_count
+                centers[center] = (
+                    point_freq * point_count
+                    + centers[center] * pixel_counts[center]
+                ) // new_count
+                pixel_counts[center] = new_count
+                color_counts[center] += 1
 
             # Create new cluster if the color point is not close enough to other clusters
-            if not belong1cluster:
-                add = [
-                    frequency[k][0],
-                    frequency[k][1],
-                    frequency[k][2],
-                    frequency[k][3],
-                    1,
-                ]
-                center_of_clusters.append(add)
+            else:
+                centers[n_clusters] = point_freq
+                pixel_counts[n_clusters] = point_count
+                color_counts[n_clusters] = 1
+                n_clusters += 1
 
         # Only keep clusters with more than cls._CLUSTER_REDUCTION_THRESHOLD color entries
-        new_center_of_clusters: List = []
-        for x in range(len(center_of_clusters)):
-            if center_of_clusters[x][4] > cls._CLUSTER_REDUCTION_THRESHOLD:
-                new_center_of_clusters.append(center_of_clusters[x])
+        keep: np.ndarray = (
+            color_counts[:n_clusters] > cls._CLUSTER_REDUCTION_THRESHOLD
+        )
 
-        return new_center_of_clusters
+        return {
+            "centers": centers[:n_clusters][keep],
+            "pixel_counts": pixel_counts[:n_clusters][keep],
+            "color_counts": color_counts[:n_clusters][keep],
+        }
 
     @classmethod
     def execute_metric(
@@ -264,17 +245,16 @@ class Metric(AIMMetricInterface):
             Results (list of measures)
             - Number of dynamic color clusters (int, [0, +inf))
         """
-        # Create PIL image
-        img: Image.Image = Image.open(BytesIO(base64.b64decode(gui_image)))
-
-        # Convert image from ??? (should be RGBA) to RGB color space
-        img_rgb: Image.Image = img.convert("RGB")
+        # Create RGB image array
+        img_rgb: np.ndarray = image_utils.base64_to_data(gui_image)
 
         # Get dynamic clusters of the input image
-        center_of_clusters: List = cls.get_dynamic_clusters(img_rgb, gui_type)
+        clusters: Dict[str, np.ndarray] = cls.get_dynamic_clusters(
+            img_rgb, gui_type
+        )
 
         # Number of dynamic clusters
-        count_dynamic_cluster: int = int(len(center_of_clusters))
+        count_dynamic_cluster: int = int(clusters["color_counts"].size)
 
         return [
             count_dynamic_cluster,
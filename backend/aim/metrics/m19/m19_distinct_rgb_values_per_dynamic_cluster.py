@@ -32,6 +32,9 @@ References:
 
 
 Change log:
+    v2.1 (2026-10-14)
+      * Read the dynamic clusters as NumPy columns
+
     v2.0 (2022-06-09)
       * Revised implementation
 
@@ -45,15 +48,14 @@ Change log:
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import base64
-from io import BytesIO
 from typing import Any, Dict, List, Optional, Union
 
 # Third-party modules
-from PIL import Image
+import numpy as np
 from pydantic import HttpUrl
 
 # First-party modules
+from aim.common import image_utils
 from aim.common.constants import GUI_TYPE_DESKTOP
 from aim.metrics.interfaces import AIMMetricInterface
 from aim.metrics.m12.m12_dynamic_clusters import Metric as m12
@@ -63,9 +65,9 @@ from aim.metrics.m12.m12_dynamic_clusters import Metric as m12
 # ----------------------------------------------------------------------------
 
 __author__ = "Amir Hossein Kargaran, Markku Laine, Thomas Langerak, Yuxi Zhu"
-__date__ = "2022-06-09"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "2.0"
+__version__ = "2.1"
 
 
 # ----------------------------------------------------------------------------
@@ -102,22 +104,20 @@ class Metric(AIMMetricInterface):
             Results (list of measures)
             - Ratio of distinct RGB values to the number of dynamic clusters (float, [0, +inf))
         """
-        # Create PIL image
-        img: Image.Image = Image.open(BytesIO(base64.b64decode(gui_image)))
-
-        # Convert image from ??? (should be RGBA) to RGB color space
-        img_rgb: Image.Image = img.convert("RGB")
+        # Create RGB image array
+        img_rgb: np.ndarray = image_utils.base64_to_data(gui_image)
 
         # Get dynamic clusters of the input image
-        center_of_clusters: List = m12.get_dynamic_clusters(img_rgb, gui_type)
+        clusters: Dict[str, np.ndarray] = m12.get_dynamic_clusters(
+            img_rgb, gui_type
+        )
+        color_counts: np.ndarray = clusters["color_counts"]
 
         # Number of dynamic clusters
-        count_dynamic_cluster: int = int(len(center_of_clusters))
+        count_dynamic_cluster: int = int(color_counts.size)
 
         # Count number of distinct RGB values in clusters
-        num_distinct_rgb: int = int(0)
-        for x in range(len(center_of_clusters)):
-            num_distinct_rgb += center_of_clusters[x][4]
+        num_distinct_rgb: int = int(color_counts.sum())
 
         # Ratio of distinct RGB values to the number of dynamic clusters
         ratio_unq_colors_dynamic_cluster: float = float(0)
@@ -25,6 +25,24 @@ References:
 
 
 Change log:
+    v1.1 (2026-10-14)
+      * Cache the model across invocations
+      * Preprocess images in float32 with a single mean subtraction
+      * Resize prediction heatmaps with OpenCV instead of scikit-image
+      * Apply the heatmap colormap through a precomputed lookup table
+      * Blend heatmap overlays in a single float32 expression
+      * Produce and encode the results one time slice at a time
+      * Encode the results to PNG directly from Numpy arrays
+      * Decode the input image with OpenCV
+      * Normalize heatmaps in place
+      * Add execute_batch() to predict multiple GUIs with a single model call
+      * Import pyplot only when showing visualizations
+      * Build the model with a single output instead of three identical ones
+      * Encode the results to PNG in parallel
+      * Blur prediction heatmaps with OpenCV instead of SciPy
+      * Plan the heatmap resize once for all time slices
+      * Read the input image size without copying its pixels
+
     v1.0 (2023-06-09)
       * Initial implementation
 """
@@ -35,23 +53,19 @@ Change log:
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import base64
-import gc
 import os
 import pathlib
 import sys
+import threading
 import warnings
-from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Third-party modules
 import cv2
 import matplotlib
 import matplotlib.cm as cm
-import matplotlib.pyplot as plt
 import numpy as np
-import scipy
-import skimage.transform as skit
 from PIL import Image
 from pydantic import HttpUrl
 
@@ -66,7 +80,7 @@ from aim.metrics.m30.multiduration_models import xception_se_lstm
 stderr = sys.stderr
 sys.stderr = open(os.devnull, "w")
 import keras  # noqa: E402
-import keras.backend as K  # noqa: E402
+import tensorflow as tf  # noqa: E402
 
 sys.stderr = stderr
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
@@ -80,9 +94,9 @@ warnings.filterwarnings("ignore", category=UserWarning, module="keras.*")
 # ----------------------------------------------------------------------------
 
 __author__ = "Markku Laine, Yao Wang"
-__date__ = "2023-06-09"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "1.0"
+__version__ = "1.1"
 
 
 # ----------------------------------------------------------------------------
@@ -101,43 +115,111 @@ class Metric(AIMMetricInterface):
     # Private constants
     _SHAPE_R: int = 240  # input shape (rows) of the model
     _SHAPE_C: int = 320  # input shape (columns) of the model
-    _SHOW: bool = False
+    _SHOW: bool = False  # debugging visualizations (pyplot imported lazily)
     _USE_CV2: bool = False
+    _BATCH_SIZE: int = 8  # max. number of images per model forward pass
+    _N_TIMES: int = 3  # number of viewing durations (0.5, 3, and 5 seconds)
     _HEATMAP_STYLE: str = "viridis"
+    _HEATMAP_COLORMAP: matplotlib.colors.Colormap = cm.get_cmap(_HEATMAP_STYLE)
+    # Colormap lookup tables, one RGB row per colormap entry
+    _HEATMAP_LUT: np.ndarray = _HEATMAP_COLORMAP(
+        np.arange(_HEATMAP_COLORMAP.N)
+    )[:, :3]
+    _HEATMAP_LUT_UINT8: np.ndarray = (_HEATMAP_LUT * 255).astype(np.uint8)
+    _HEATMAP_LUT_FLOAT32: np.ndarray = (_HEATMAP_LUT * 255).astype(np.float32)
+    _MEAN_BGR: np.ndarray = np.array(
+        [103.939, 116.779, 123.68], dtype=np.float32
+    )  # per-channel mean subtracted from the model input
+    _MODEL_FILEPATH: pathlib.Path = pathlib.Path(
+        "aim/metrics/m30/massvis_bucket_500_2000_5000_kl10cc-5nss-1ccmatch3_ep06_valloss1.1899.hdf5"
+    )
+
+    # Private variables
+    # The model is built lazily on first use and kept in a dedicated graph
+    # and session, so that other Keras metrics calling K.clear_session()
+    # do not invalidate it.
+    _model: Optional[keras.models.Model] = None
+    _graph: Optional[tf.Graph] = None
+    _session: Optional[tf.compat.v1.Session] = None
+    _model_lock: threading.Lock = threading.Lock()
+    # OpenCV releases the GIL while encoding, so the PNG encodes of a batch
+    # run in parallel with each other and with the postprocessing of the
+    # next time slice
+    _encoder_pool: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=min(2 * _N_TIMES, os.cpu_count() or 1),
+        thread_name_prefix="m30-encoder",
+    )
 
     # Private methods
+    @classmethod
+    def _get_model(cls) -> keras.models.Model:
+        """
+        Get the model, building it and loading its weights on first use.
+
+        Returns:
+            Model with weights loaded
+        """
+        if cls._model is None:
+            with cls._model_lock:
+                if cls._model is None:
+                    graph: tf.Graph = tf.Graph()
+                    session: tf.compat.v1.Session = tf.compat.v1.Session(
+                        graph=graph
+                    )
+                    with graph.as_default(), session.as_default():
+                        # The model's outputs would all be the same
+                        # decoder tensor, so build it with a single output
+                        # instead of having Keras fetch and concatenate
+                        # identical copies
+                        model: keras.models.Model = xception_se_lstm(
+                            input_shape=(cls._SHAPE_R, cls._SHAPE_C, 3),
+                            n_outs=1,
+                            ups=16,
+                            verbose=False,
+                        )
+                        model.load_weights(cls._MODEL_FILEPATH)
+                        model._make_predict_function()
+                    cls._graph = graph
+                    cls._session = session
+                    cls._model = model
+
+        return cls._model
+
     @classmethod
     def _preprocess_images(
-        cls, original_images: List[Image.Image], show: bool = False
+        cls, original_images: List[np.ndarray], show: bool = False
     ) -> np.ndarray:
         """
         Preprocess images to the size required by the model.
 
         Args:
-            original_images: List of original images
+            original_images: List of original images (RGB image data)
             show: True, if input visualizations must be shown.
                   Otherwise, False
 
         Returns:
             Preprocessed image data with the shape of (n_images, rows, columns, channels)
         """
-        imgs: np.ndarray = np.zeros(
-            (len(original_images), cls._SHAPE_R, cls._SHAPE_C, 3)
+        imgs: np.ndarray = np.empty(
+            (len(original_images), cls._SHAPE_R, cls._SHAPE_C, 3),
+            dtype=np.float32,
         )
 
         for i, original_image in enumerate(original_images):
             img: Union[np.ndarray, Image.Image]
             if cls._USE_CV2:
-                img = cv2.cvtColor(
-                    np.asarray(original_image), cv2.COLOR_RGB2BGR
-                )
+                img = cv2.cvtColor(original_image, cv2.COLOR_RGB2BGR)
             else:
-                img = original_image
+                img = Image.fromarray(original_image)
 
+            # Convert to float32 and subtract the mean in a single pass
             padded_image: np.ndarray = cls._padding(img)
-            imgs[i] = padded_image
+            np.subtract(padded_image, cls._MEAN_BGR, out=imgs[i])
 
             if show:
+                # Third-party modules
+                import matplotlib.pyplot as plt
+
                 plt.figure(figsize=[15, 7])
                 plt.subplot(1, 2, 1)
                 if cls._USE_CV2:
@@ -153,10 +235,6 @@ class Metric(AIMMetricInterface):
                 plt.title("Input to network")
                 plt.show()
 
-        imgs[:, :, :, 0] -= 103.939
-        imgs[:, :, :, 1] -= 116.779
-        imgs[:, :, :, 2] -= 123.68
-
         return imgs
 
     @classmethod
@@ -177,11 +255,16 @@ class Metric(AIMMetricInterface):
             (cls._SHAPE_R, cls._SHAPE_C, 3), dtype=np.uint8
         )
 
-        original_shape: Union[Tuple[int, ...], Any]
+        original_shape: Tuple[int, ...]
         if cls._USE_CV2:
             original_shape = original_image.shape
         else:
-            original_shape = np.asarray(original_image).shape
+            # Read the size from the PIL image instead of converting it to
+            # an array just for its shape
+            width: int
+            height: int
+            width, height = original_image.size
+            original_shape = (height, width, 3)
 
         rows_rate: float = original_shape[0] / cls._SHAPE_R
         cols_rate: float = original_shape[1] / cls._SHAPE_C
@@ -232,26 +315,78 @@ class Metric(AIMMetricInterface):
 
         return img_padded
 
+    @classmethod
+    def _plan_resize(
+        cls,
+        original_shape: Tuple[int, ...],
+        prediction_shape: Tuple[int, ...],
+    ) -> Tuple[Tuple[int, int], Tuple[slice, slice]]:
+        """
+        Plan how a prediction is resized back to the original size.
+
+        The prediction is resized, keeping its aspect ratio, to cover the
+        original image and then center cropped to the original size.
+
+        Args:
+            original_shape: Shape of the original image (rows, columns, ...)
+            prediction_shape: Shape of the prediction (rows, columns)
+
+        Returns:
+            Resize target size (columns, rows) and crop box (row slice,
+            column slice)
+        """
+        height: int = original_shape[0]
+        width: int = original_shape[1]
+        rows_rate: float = height / prediction_shape[0]
+        cols_rate: float = width / prediction_shape[1]
+
+        offset: int
+        if rows_rate > cols_rate:
+            new_cols: int = (prediction_shape[1] * height) // prediction_shape[
+                0
+            ]
+            offset = (new_cols - width) // 2
+            return (new_cols, height), (
+                slice(None),
+                slice(offset, offset + width),
+            )
+        else:
+            new_rows: int = (prediction_shape[0] * width) // prediction_shape[
+                1
+            ]
+            offset = (new_rows - height) // 2
+            return (width, new_rows), (
+                slice(offset, offset + height),
+                slice(None),
+            )
+
     @classmethod
     def _postprocess_predictions(
         cls,
-        original_images: List[Image.Image],
-        predictions: List[np.ndarray],
+        original_images: List[np.ndarray],
+        predictions: np.ndarray,
         n_time: int = 0,
         blur: bool = False,
         normalize: bool = False,
+        resize_plans: Optional[
+            List[Tuple[Tuple[int, int], Tuple[slice, slice]]]
+        ] = None,
     ) -> List[np.ndarray]:
         """
         Postprocess predictions back to the original size.
 
         Args:
             original_images: List of original images
-            predictions: Heatmaps predicted by the model
+            predictions: Heatmaps predicted by the model with the shape of
+                         (n_images, n_times, rows, columns, 1)
             n_times: Number of time slices, can be 0, 1, or 2
             blur: True, if prediction heatmaps must be blurred.
                   Otherwise, False
             normalize: True, if prediction heatmaps must be normalized from
                        [0, 1] to [0, 255]
+            resize_plans: Resize plans of the original images (see
+                          _plan_resize), shared by all time slices.
+                          Computed if not given
 
         Returns:
             Postprocessed prediction heatmaps
@@ -260,62 +395,62 @@ class Metric(AIMMetricInterface):
 
         assert n_time == 0 or n_time == 1 or n_time == 2
 
-        for i, original_image in enumerate(original_images):
-            width: int
-            height: int
-            width, height = original_image.size
-            prediction: np.ndarray = predictions[0][i, n_time, :, :, 0]
-            prediction_shape: Tuple[int, ...] = prediction.shape
-            rows_rate: float = height / prediction_shape[0]
-            cols_rate: float = width / prediction_shape[1]
+        if resize_plans is None:
+            resize_plans = [
+                cls._plan_resize(original_image.shape, predictions.shape[2:4])
+                for original_image in original_images
+            ]
+
+        for i, (resize_target, crop_box) in enumerate(resize_plans):
+            prediction: np.ndarray = np.ascontiguousarray(
+                predictions[i, n_time, :, :, 0], dtype=np.float32
+            )
 
             if blur:
-                sigma: bool = blur
-                prediction = scipy.ndimage.filters.gaussian_filter(
-                    prediction, sigma=sigma
+                # Same kernel as scipy.ndimage.gaussian_filter(), i.e.,
+                # truncated at 4 standard deviations with reflected borders
+                sigma: float = float(blur)
+                ksize: int = 2 * int(4.0 * sigma + 0.5) + 1
+                prediction = cv2.GaussianBlur(
+                    prediction,
+                    (ksize, ksize),
+                    sigmaX=sigma,
+                    sigmaY=sigma,
+                    borderType=cv2.BORDER_REFLECT,
                 )
-            img: np.ndarray
-            if rows_rate > cols_rate:
-                new_cols: int = (
-                    prediction_shape[1] * height
-                ) // prediction_shape[0]
-                if cls._USE_CV2:
-                    prediction = cv2.resize(prediction, (new_cols, height))
-                else:
-                    prediction = skit.resize(prediction, (height, new_cols))
-                img = prediction[
-                    :,
-                    ((prediction.shape[1] - width) // 2) : (
-                        (prediction.shape[1] - width) // 2 + width
-                    ),
-                ]
-            else:
-                new_rows: int = (
-                    prediction_shape[0] * width
-                ) // prediction_shape[1]
-                if cls._USE_CV2:
-                    prediction = cv2.resize(prediction, (width, new_rows))
-                else:
-                    prediction = skit.resize(prediction, (new_rows, width))
-                img = prediction[
-                    ((prediction.shape[0] - height) // 2) : (
-                        (prediction.shape[0] - height) // 2 + height
-                    ),
-                    :,
-                ]
+            img: np.ndarray = cv2.resize(
+                prediction, resize_target, interpolation=cv2.INTER_LINEAR
+            )[crop_box]
 
             if normalize:
-                img = img / np.max(img) * 255
+                img /= np.max(img)
+                img *= 255
             heatmap_batch.append(img)
 
         return heatmap_batch
 
+    @classmethod
+    def _colormap_indices(cls, heatmap: np.ndarray) -> np.ndarray:
+        """
+        Map heatmap values to colormap lookup table indices.
+
+        Values are mapped the same way as matplotlib colormaps do it, i.e.,
+        values below 0 and above 1 are clipped to the first and last entry.
+
+        Args:
+            heatmap: Heatmap with values in the range [0, 1]
+
+        Returns:
+            Lookup table indices with the same shape as the heatmap
+        """
+        lut_size: int = cls._HEATMAP_LUT.shape[0]
+        return np.clip(heatmap * lut_size, 0, lut_size - 1).astype(np.intp)
+
     @classmethod
     def _heatmap_overlays(
         cls,
-        original_images: List[Image.Image],
+        original_images: List[np.ndarray],
         heatmaps: List[np.ndarray],
-        colmap: str = "hot",
     ) -> List[np.ndarray]:
         """
         Overlay prediction heatmap on the original image.
@@ -323,7 +458,6 @@ class Metric(AIMMetricInterface):
         Args:
             original_images: List of original images
             heatmaps: Prediction heatmaps
-            colmap: Heatmap style
 
         Returns:
             Prediction heatmap overlays
@@ -331,19 +465,23 @@ class Metric(AIMMetricInterface):
         heatmap_overlay_batch: List[np.ndarray] = []
         for i, original_image in enumerate(original_images):
             heatmap: np.ndarray = heatmaps[i]
-            cm_array: matplotlib.colors.ListedColormap = cm.get_cmap(colmap)
             im_array: np.ndarray = np.asarray(original_image)
-            heatmap_norm: np.ndarray = (heatmap - np.min(heatmap)) / float(
-                np.max(heatmap) - np.min(heatmap)
-            )
-            heatmap_cm: np.ndarray = cm_array(heatmap_norm)
-            res_final: np.ndarray = im_array.copy()
-            heatmap_rep: np.ndarray = np.repeat(
-                heatmap_norm[:, :, np.newaxis], 3, axis=2
-            )
-            res_final[...] = heatmap_cm[
-                ..., 0:3
-            ] * 255.0 * heatmap_rep + im_array[...] * (1 - heatmap_rep)
+            heatmap_min: float = heatmap.min()
+            heatmap_range: float = heatmap.max() - heatmap_min
+            heatmap_norm: np.ndarray = heatmap - heatmap_min
+            if heatmap_range > 0:
+                heatmap_norm /= heatmap_range
+            # Alpha blend in float32, broadcasting the per-pixel alpha over
+            # the color channels
+            alpha: np.ndarray = heatmap_norm.astype(np.float32, copy=False)[
+                :, :, np.newaxis
+            ]
+            heatmap_cm: np.ndarray = cls._HEATMAP_LUT_FLOAT32[
+                cls._colormap_indices(heatmap_norm)
+            ]
+            res_final: np.ndarray = (
+                heatmap_cm * alpha + im_array * (1 - alpha)
+            ).astype(np.uint8)
             heatmap_overlay_batch.append(res_final)
 
         return heatmap_overlay_batch
@@ -351,7 +489,7 @@ class Metric(AIMMetricInterface):
     @classmethod
     def _show_results(
         cls,
-        original_images: List[Image.Image],
+        original_images: List[np.ndarray],
         heatmaps: List[np.ndarray],
         heatmap_overlays: List[np.ndarray],
     ) -> None:
@@ -366,6 +504,9 @@ class Metric(AIMMetricInterface):
         Returns:
             None
         """
+        # Third-party modules
+        import matplotlib.pyplot as plt
+
         for i, _ in enumerate(original_images):
             plt.figure(figsize=[15, 7])
             plt.subplot(1, 3, 1)
@@ -381,144 +522,122 @@ class Metric(AIMMetricInterface):
 
     # Public methods
     @classmethod
-    def execute_metric(
+    def execute_batch(
         cls,
-        gui_image: str,
+        gui_images: List[str],
         gui_type: int = GUI_TYPE_DESKTOP,
-        gui_segments: Optional[Dict[str, Any]] = None,
-        gui_url: Optional[HttpUrl] = None,
-    ) -> Optional[List[Union[int, float, str]]]:
+    ) -> List[Optional[List[Union[int, float, str]]]]:
         """
-        Execute the metric.
+        Execute the metric for a batch of GUIs with a single model call.
 
         Args:
-            gui_image: GUI image (PNG) encoded in Base64
+            gui_images: GUI images (PNG) encoded in Base64
 
         Kwargs:
             gui_type: GUI type, desktop = 0 (default), mobile = 1
-            gui_segments: GUI segments (defaults to None)
-            gui_url: GUI URL (defaults to None)
 
         Returns:
-            Results (list of measures)
-            - UMSI prediction heatmap (str, image (PNG) encoded in Base64)
-            - UMSI prediction heatmap overlay (str, image (PNG) encoded in Base64)
+            Results (list of measures) for each GUI image, in the same order
+            as the input images (see execute_metric)
         """
-        # Create PIL image
-        img: Image.Image = Image.open(BytesIO(base64.b64decode(gui_image)))
-
-        # Convert image from ??? (e.g., RGBA) to RGB color space
-        img_rgb: Image.Image = img.convert("RGB")
-
-        # Original images to be predicted
-        original_images: List[Image.Image] = []
-        original_images.append(img_rgb)
+        # Decode images to RGB image data
+        original_images: List[np.ndarray] = [
+            image_utils.base64_to_data(gui_image) for gui_image in gui_images
+        ]
 
         # Preprocess images
         img_batch: np.ndarray = cls._preprocess_images(
             original_images, show=cls._SHOW
         )
 
-        # Load model
-        model_filepath: pathlib.Path = pathlib.Path(
-            "aim/metrics/m30/massvis_bucket_500_2000_5000_kl10cc-5nss-1ccmatch3_ep06_valloss1.1899.hdf5"
-        )
-
-        loaded_model = xception_se_lstm(
-            input_shape=(240, 320, 3), n_outs=3, ups=16, verbose=False
-        )
-
-        loaded_model.load_weights(model_filepath)
+        # Load model (cached across invocations)
+        model: keras.models.Model = cls._get_model()
 
         # Predict maps
-        predictions: List[np.ndarray] = loaded_model.predict(img_batch)
-
-        # Postprocess predictions
-        heatmap_batch0: List[np.ndarray] = cls._postprocess_predictions(
-            original_images, predictions, n_time=0
-        )
-        heatmap_batch1: List[np.ndarray] = cls._postprocess_predictions(
-            original_images, predictions, n_time=1
-        )
-        heatmap_batch2: List[np.ndarray] = cls._postprocess_predictions(
-            original_images, predictions, n_time=2
-        )
-
-        # Create prediction heatmap overlays
-        heatmap_overlay_batch0: List[np.ndarray] = cls._heatmap_overlays(
-            original_images, heatmap_batch0, colmap=cls._HEATMAP_STYLE
-        )
-        heatmap_overlay_batch1: List[np.ndarray] = cls._heatmap_overlays(
-            original_images, heatmap_batch1, colmap=cls._HEATMAP_STYLE
-        )
-        heatmap_overlay_batch2: List[np.ndarray] = cls._heatmap_overlays(
-            original_images, heatmap_batch2, colmap=cls._HEATMAP_STYLE
-        )
-
-        # Show results
-        if cls._SHOW:
-            cls._show_results(
-                original_images, heatmap_batch0, heatmap_overlay_batch0
+        with cls._graph.as_default(), cls._session.as_default():  # type: ignore
+            predictions: np.ndarray = model.predict(
+                img_batch, batch_size=cls._BATCH_SIZE
             )
-            cls._show_results(
-                original_images, heatmap_batch1, heatmap_overlay_batch1
+
+        # Postprocess predictions and create prediction heatmap overlays one
+        # time slice at a time, so that only one slice's float arrays are
+        # held in memory at once, and encode the results in the background
+        heatmap_futures: List[List[Future]] = [[] for _ in original_images]
+        heatmap_overlay_futures: List[List[Future]] = [
+            [] for _ in original_images
+        ]
+        resize_plans: List[Tuple[Tuple[int, int], Tuple[slice, slice]]] = [
+            cls._plan_resize(original_image.shape, predictions.shape[2:4])
+            for original_image in original_images
+        ]
+        for n_time in range(cls._N_TIMES):
+            heatmap_batch: List[np.ndarray] = cls._postprocess_predictions(
+                original_images,
+                predictions,
+                n_time=n_time,
+                resize_plans=resize_plans,
             )
-            cls._show_results(
-                original_images, heatmap_batch2, heatmap_overlay_batch2
+            heatmap_overlay_batch: List[np.ndarray] = cls._heatmap_overlays(
+                original_images, heatmap_batch
             )
 
-        # Prepare final results
-        # Apply the color map, rescale to the 0-255 range, convert to
-        # 8-bit unsigned integers. Note: Slight loss of accuracy due
-        # the float32 to uint8 conversion.
-        img_prediction_heatmap0: Image.Image = Image.fromarray(
-            (cm.get_cmap("viridis")(heatmap_batch0[0]) * 255).astype("uint8")
-        ).convert("RGB")
-        img_prediction_heatmap1: Image.Image = Image.fromarray(
-            (cm.get_cmap("viridis")(heatmap_batch1[0]) * 255).astype("uint8")
-        ).convert("RGB")
-        img_prediction_heatmap2: Image.Image = Image.fromarray(
-            (cm.get_cmap("viridis")(heatmap_batch2[0]) * 255).astype("uint8")
-        ).convert("RGB")
-        img_prediction_heatmap0_overlay: Image.Image = Image.fromarray(
-            heatmap_overlay_batch0[0]
-        ).convert("RGB")
-        img_prediction_heatmap1_overlay: Image.Image = Image.fromarray(
-            heatmap_overlay_batch1[0]
-        ).convert("RGB")
-        img_prediction_heatmap2_overlay: Image.Image = Image.fromarray(
-            heatmap_overlay_batch2[0]
-        ).convert("RGB")
-        mdeam_prediction_heatmap0: str = image_utils.to_png_image_base64(
-            img_prediction_heatmap0
-        )
-        mdeam_prediction_heatmap1: str = image_utils.to_png_image_base64(
-            img_prediction_heatmap1
-        )
-        mdeam_prediction_heatmap2: str = image_utils.to_png_image_base64(
-            img_prediction_heatmap2
-        )
-        mdeam_prediction_heatmap0_overlay: str = (
-            image_utils.to_png_image_base64(img_prediction_heatmap0_overlay)
-        )
-        mdeam_prediction_heatmap1_overlay: str = (
-            image_utils.to_png_image_base64(img_prediction_heatmap1_overlay)
-        )
-        mdeam_prediction_heatmap2_overlay: str = (
-            image_utils.to_png_image_base64(img_prediction_heatmap2_overlay)
-        )
+            # Show results
+            if cls._SHOW:
+                cls._show_results(
+                    original_images, heatmap_batch, heatmap_overlay_batch
+                )
 
-        # Clean up to prevent Keras memory leaks
-        # Source: https://www.thekerneltrip.com/python/keras-memory-leak/
-        del loaded_model
-        K.clear_session()
-        _ = gc.collect()
+            # Prepare final results
+            # Apply the color map, rescale to the 0-255 range, convert to
+            # 8-bit unsigned integers. Note: Slight loss of accuracy due
+            # the float32 to uint8 conversion.
+            for i, (heatmap, heatmap_overlay) in enumerate(
+                zip(heatmap_batch, heatmap_overlay_batch)
+            ):
+                heatmap_futures[i].append(
+                    cls._encoder_pool.submit(
+                        image_utils.data_to_png_image_base64,
+                        cls._HEATMAP_LUT_UINT8[cls._colormap_indices(heatmap)],
+                    )
+                )
+                heatmap_overlay_futures[i].append(
+                    cls._encoder_pool.submit(
+                        image_utils.data_to_png_image_base64, heatmap_overlay
+                    )
+                )
+            del heatmap_batch, heatmap_overlay_batch
 
         return [
-            mdeam_prediction_heatmap0,  # at 0.5s
-            mdeam_prediction_heatmap1,  # at 3s
-            mdeam_prediction_heatmap2,  # at 5s
-            mdeam_prediction_heatmap0_overlay,  # at 0.5s
-            mdeam_prediction_heatmap1_overlay,  # at 3s
-            mdeam_prediction_heatmap2_overlay,  # at 5s
+            [
+                # Heatmaps and heatmap overlays at 0.5s, 3s, and 5s
+                *(future.result() for future in heatmap_futures[i]),
+                *(future.result() for future in heatmap_overlay_futures[i]),
+            ]
+            for i in range(len(original_images))
         ]
+
+    @classmethod
+    def execute_metric(
+        cls,
+        gui_image: str,
+        gui_type: int = GUI_TYPE_DESKTOP,
+        gui_segments: Optional[Dict[str, Any]] = None,
+        gui_url: Optional[HttpUrl] = None,
+    ) -> Optional[List[Union[int, float, str]]]:
+        """
+        Execute the metric.
+
+        Args:
+            gui_image: GUI image (PNG) encoded in Base64
+
+        Kwargs:
+            gui_type: GUI type, desktop = 0 (default), mobile = 1
+            gui_segments: GUI segments (defaults to None)
+            gui_url: GUI URL (defaults to None)
+
+        Returns:
+            Results (list of measures)
+            - UMSI prediction heatmap (str, image (PNG) encoded in Base64)
+            - UMSI prediction heatmap overlay (str, image (PNG) encoded in Base64)
+        """
+        return cls.execute_batch([gui_image], gui_type=gui_type)[0]
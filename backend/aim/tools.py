@@ -11,13 +11,17 @@ Tools.
 # ----------------------------------------------------------------------------
 
 # Standard library modules
+import base64
 import importlib
+import math
 import platform
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 # Third-party modules
@@ -27,9 +31,12 @@ import pandas as pd
 import seaborn as sns
 from loguru import logger
 from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
-from selenium.webdriver.common.by import By
 
 # First-party modules
 from aim.common import image_utils, utils
@@ -60,7 +67,16 @@ class Screenshot:
 
     # Public constants
     NAME: str = "Screenshot"
-    VERSION: str = "1.1"
+    VERSION: str = "1.2"
+
+    # Private constants
+    # Platform-specific ChromeDriver executable, None if not available for
+    # the current platform
+    _CHROME_DRIVER_FILE_PATH: Optional[str] = {
+        "Windows": "{}_windows.exe".format(CHROME_DRIVER_BASE_FILE_PATH),
+        "Linux": "{}_linux".format(CHROME_DRIVER_BASE_FILE_PATH),
+        "Darwin": "{}_mac".format(CHROME_DRIVER_BASE_FILE_PATH),
+    }.get(platform.system())
 
     # Initializer
     def __init__(
@@ -70,36 +86,208 @@ class Screenshot:
         height: int,
         full_page: bool,
         output_dir: Path,
+        workers: int = 1,
     ):
         self.input_file: Path = input_file
-        self.input_urls: List[str] = []
         self.width: int = width
         self.height: int = height
         self.full_page: bool = full_page
         self.output_dir: Path = output_dir
-        self.driver: ChromeWebDriver = None
+        self.workers: int = workers
+        self.url_counter: int = 0
         self.success_counter: int = 0
 
     # Private methods
-    def _read_input_urls(self) -> None:
+    def _read_input_urls(self) -> Iterator[str]:
+        # Stream input URLs one line at a time, skipping blank lines
         with open(self.input_file) as f:
-            self.input_urls = f.readlines()
+            for line in f:
+                input_url: str = line.strip()
+                if input_url:
+                    yield input_url
+
+    def _get_document_size(self, driver: ChromeWebDriver) -> Tuple[int, int]:
+        # Get the size of the page content in CSS pixels (older Chrome
+        # versions only report contentSize)
+        layout_metrics: Dict[str, Any] = driver.execute_cdp_cmd(
+            "Page.getLayoutMetrics", {}
+        )
+        content_size: Dict[str, float] = layout_metrics.get(
+            "cssContentSize", layout_metrics["contentSize"]
+        )
+
+        return (
+            math.ceil(content_size["width"]),
+            math.ceil(content_size["height"]),
+        )
+
+    def _restart_web_driver(self, driver: ChromeWebDriver) -> ChromeWebDriver:
+        # Close the browser and start a new one
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
 
-        self.input_urls = [input_url.strip() for input_url in self.input_urls]
+        return self.get_web_driver(self.width, self.height)
 
-    def _get_document_size(self) -> Tuple[int, int]:
-        width: int = self.driver.execute_script(
-            "return document.body.parentNode.scrollWidth"
+    @staticmethod
+    def _write_screenshot(screenshot_file: Path, screenshot_data: str) -> None:
+        # Write the decoded image to the file in one go
+        screenshot_file.write_bytes(base64.b64decode(screenshot_data))
+
+    def _save_screenshot(
+        self,
+        driver: ChromeWebDriver,
+        screenshot_file: Path,
+        writer: ThreadPoolExecutor,
+        capture_options: Optional[Dict[str, Any]] = None,
+    ) -> Future:
+        # Capture the screenshot as PNG with the Chrome DevTools Protocol and
+        # leave writing it to the writer, so that the browser can move on to
+        # the next URL in the meantime
+        screenshot: Dict[str, Any] = driver.execute_cdp_cmd(
+            "Page.captureScreenshot",
+            {"format": "png", **(capture_options or {})},
         )
-        height: int = self.driver.execute_script(
-            "return document.body.parentNode.scrollHeight"
+
+        return writer.submit(
+            self._write_screenshot, screenshot_file, screenshot["data"]
         )
 
-        return (width, height)
+    def _take_screenshot(
+        self,
+        driver: ChromeWebDriver,
+        input_url: str,
+        writer: ThreadPoolExecutor,
+    ) -> Future:
+        screenshot_file: Path = self.output_dir / "{}.png".format(
+            urlparse(input_url).hostname
+        )
+
+        driver.get(input_url)
+
+        # Take full page screenshot, capturing the whole document beyond the
+        # viewport without resizing the window (the screenshot size is the
+        # minimum size)
+        if self.full_page:
+            document_size: Tuple[int, int] = self._get_document_size(driver)
+            screenshot_written: Future = self._save_screenshot(
+                driver,
+                screenshot_file,
+                writer,
+                {
+                    "captureBeyondViewport": True,
+                    "clip": {
+                        "x": 0,
+                        "y": 0,
+                        "width": max(document_size[0], self.width),
+                        "height": max(document_size[1], self.height),
+                        "scale": 1,
+                    },
+                },
+            )
+        # Take fixed size screenshot
+        else:
+            screenshot_written = self._save_screenshot(
+                driver, screenshot_file, writer
+            )
+
+        # Do not let cookies accumulate from one URL to the next
+        driver.delete_all_cookies()
+
+        return screenshot_written
+
+    def _wait_screenshot_written(
+        self, input_url: str, screenshot_written: Future
+    ) -> bool:
+        # Wait until the screenshot of the URL has been written to its file
+        try:
+            screenshot_written.result()
+        except Exception as err:
+            logger.error(
+                "Failed to write a screenshot of {}".format(input_url)
+            )
+            logger.error(err)
+            return False
+
+        return True
+
+    def _take_screenshots(
+        self,
+        input_urls: Iterator[str],
+        input_urls_lock: threading.Lock,
+        writer: ThreadPoolExecutor,
+    ) -> int:
+        # Take screenshots of the shared input URLs with a browser of its
+        # own, until there are no URLs left, and count the successful ones.
+        # The browser is started only once there is a URL to take. While
+        # the browser loads the next URL, the previous screenshot is being
+        # written (at most one pending write per browser)
+        success_counter: int = 0
+        driver: Optional[ChromeWebDriver] = None
+        pending: Optional[Tuple[str, Future]] = None
+        try:
+            while True:
+                with input_urls_lock:
+                    input_url: Optional[str] = next(input_urls, None)
+                    if input_url is not None:
+                        self.url_counter += 1
+                if input_url is None:
+                    break
+
+                if driver is None:
+                    driver = self.get_web_driver(self.width, self.height)
+
+                logger.info("Taking a screenshot of {}".format(input_url))
+
+                try:
+                    try:
+                        screenshot_written: Future = self._take_screenshot(
+                            driver, input_url, writer
+                        )
+                    except InvalidSessionIdException:
+                        # The browser session is gone (e.g., Chrome crashed),
+                        # so start a new browser and retry once
+                        logger.warning(
+                            "Browser session lost, restarting the browser"
+                        )
+                        driver = self._restart_web_driver(driver)
+                        screenshot_written = self._take_screenshot(
+                            driver, input_url, writer
+                        )
+                except Exception as err:
+                    logger.error(
+                        "Failed to take a screenshot of {}".format(input_url)
+                    )
+                    logger.error(err)
+                else:
+                    if pending is not None and self._wait_screenshot_written(
+                        *pending
+                    ):
+                        success_counter += 1
+                    pending = (input_url, screenshot_written)
+
+            if pending is not None and self._wait_screenshot_written(*pending):
+                success_counter += 1
+        finally:
+            # Close the browser
+            if driver is not None:
+                driver.quit()
+
+        return success_counter
 
     # Public methods
-    @staticmethod
-    def get_web_driver() -> ChromeWebDriver:
+    @classmethod
+    def get_web_driver(
+        cls, width: Optional[int] = None, height: Optional[int] = None
+    ) -> ChromeWebDriver:
+        if cls._CHROME_DRIVER_FILE_PATH is None:
+            raise RuntimeError(
+                "ChromeDriver is not available for platform '{}'.".format(
+                    platform.system()
+                )
+            )
+
         options: ChromeOptions = ChromeOptions()
         options.add_argument("--headless")
         options.add_argument("--no-sandbox")
@@ -107,70 +295,47 @@ class Screenshot:
         options.add_argument("--hide-scrollbars")
         options.add_argument("--disable-gpu")
         options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-extensions")
+        # Do not throttle browsers running in parallel in the background
+        options.add_argument("--disable-renderer-backgrounding")
+        options.add_argument("--disable-backgrounding-occluded-windows")
+        options.add_argument("--disable-background-timer-throttling")
         options.add_argument("--user-agent=Mozilla/5.0")
         options.add_argument("--lang=en-US,en;q=0.9")
-
-        plt: str = platform.system()
-        executable_path: str
-        if plt == "Windows":
-            executable_path = "{}_windows.exe".format(
-                CHROME_DRIVER_BASE_FILE_PATH
-            )
-        elif plt == "Linux":
-            executable_path = "{}_linux".format(CHROME_DRIVER_BASE_FILE_PATH)
-        elif plt == "Darwin":
-            executable_path = "{}_mac".format(CHROME_DRIVER_BASE_FILE_PATH)
+        if width is not None and height is not None:
+            options.add_argument("--window-size={},{}".format(width, height))
 
         return webdriver.Chrome(
-            executable_path=executable_path, options=options
+            executable_path=cls._CHROME_DRIVER_FILE_PATH, options=options
         )
 
     def take(self) -> None:
         # Read input URLs
-        self._read_input_urls()
+        input_urls: Iterator[str] = self._read_input_urls()
 
-        # Get web driver
-        self.driver = self.get_web_driver()
-
-        # Iterate over input URLs
+        # Take screenshots with a pool of browsers. Each worker drives a
+        # browser of its own, reusing it for all the URLs it takes from the
+        # shared input URLs, and hands the screenshots over to a pool of
+        # writers
+        self.url_counter = 0
         self.success_counter = 0
-        for input_url in self.input_urls:
-            logger.info("Taking a screenshot of {}".format(input_url))
-
-            try:
-                self.driver.set_window_size(self.width, self.height)
-                self.driver.get(input_url)
-
-                # Take full page screenshot
-                if self.full_page:
-                    document_size: Tuple[int, int] = self._get_document_size()
-                    self.driver.set_window_size(
-                        document_size[0], document_size[1]
-                    )
-                    self.driver.find_element(By.TAG_NAME, "body").screenshot(
-                        str(
-                            self.output_dir
-                            / "{}.png".format(urlparse(input_url).hostname)
-                        )
-                    )
-                # Take fixed size screenshot
-                else:
-                    self.driver.save_screenshot(
-                        str(
-                            self.output_dir
-                            / "{}.png".format(urlparse(input_url).hostname)
-                        )
-                    )
-            except Exception as err:
-                logger.error(
-                    "Failed to take a screenshot of {}".format(input_url)
+        n_workers: int = max(self.workers, 1)
+        input_urls_lock: threading.Lock = threading.Lock()
+        with ThreadPoolExecutor(
+            max_workers=n_workers, thread_name_prefix="screenshot-writer"
+        ) as writer, ThreadPoolExecutor(max_workers=n_workers) as executor:
+            success_counters: List[Future] = [
+                executor.submit(
+                    self._take_screenshots,
+                    input_urls,
+                    input_urls_lock,
+                    writer,
                 )
-                logger.error(err)
-            else:
-                self.success_counter += 1
-
-        # Close the browser
-        self.driver.quit()
+                for _ in range(n_workers)
+            ]
+        self.success_counter = sum(
+            success_counter.result() for success_counter in success_counters
+        )
 
 
 class Evaluation:
@@ -5,9 +5,9 @@
 Screenshoter utility application.
 
 
-Usage: screenshoter.py [-h] [-c <path>] [-v] [-i <path>] [-sw <int>] [-sh <int>] [-f] [-o <path>]
+Usage: screenshoter.py [-h] [-c <path>] [-v] [-i <path>] [-sw <int>] [-sh <int>] [-f] [-w <int>] [-o <path>]
 
-Example usage: python screenshoter.py -i data/screenshots/ALEXA_500/urls.csv -sw 1280 -sh 800 -f -o data/screenshots/results/
+Example usage: python screenshoter.py -i data/screenshots/ALEXA_500/urls.csv -sw 1280 -sh 800 -f -w 4 -o data/screenshots/results/
 """
 
 
@@ -91,6 +91,15 @@ def init():
         action="store_true",
         default=False,
     )
+    configmanager.parser.add(
+        "-w",
+        metavar="<int>",
+        help="number of browsers taking screenshots in parallel",
+        dest="workers",
+        type=int,
+        required=False,
+        default=constants.SCREENSHOTER_WORKERS,
+    )
     configmanager.parser.add(
         "-o",
         metavar="<path>",
@@ -131,13 +140,14 @@ def main():
             height=configmanager.options.height,
             full_page=configmanager.options.full_page,
             output_dir=Path(configmanager.options.output),
+            workers=configmanager.options.workers,
         )
         screenshot.take()
-        if len(screenshot.input_urls) > 0:
+        if screenshot.url_counter > 0:
             logger.info(
                 "{} out of {} screenshots were successfully taken and stored at '{}'.".format(
                     screenshot.success_counter,
-                    len(screenshot.input_urls),
+                    screenshot.url_counter,
                     screenshot.output_dir,
                 )
             )
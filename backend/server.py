@@ -13,26 +13,40 @@ AIM backend server.
 # Standard library modules
 import logging
 import os
+import socket
 import time
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 # Third-party modules
 import motor
+import tornado.httpserver
 import tornado.ioloop
 import tornado.log
+import tornado.netutil
 import tornado.options
+import tornado.process
+import tornado.queues
+import tornado.util
 import tornado.web
 import tornado.websocket
 from dotenv import load_dotenv
 from loguru import logger
 from motor.motor_tornado import MotorClient, MotorDatabase
+from pymongo.errors import PyMongoError
 from tornado.log import LogFormatter
 from tornado.options import define, options
 
 # First-party modules
-from aim.common import configmanager, utils
-from aim.handlers import AIMWebSocketHandler
+from aim.common import configmanager, constants, utils
+
+# isort: off
+# First-party modules - Suppress Tensorflow logs before the handlers import
+# Tensorflow
+logging.getLogger("tensorflow").setLevel(logging.CRITICAL)
+from aim.handlers import AIMWebSocketHandler  # noqa: E402
+
+# isort: on
 
 # ----------------------------------------------------------------------------
 # Metadata
@@ -66,6 +80,12 @@ define(
     type=Path,
 )
 define("database_uri", default=None, help="Database URI", type=str)
+define(
+    "autoreload",
+    default=False,
+    help="Restart the server on source file changes",
+    type=bool,
+)
 # In addition, Tornado provides built-in support for the "logging" (level) option
 
 
@@ -82,38 +102,48 @@ load_dotenv()
 
 
 def parse_environ_options() -> None:
-    port = os.environ.get("PORT")
-    data_inputs_dir = os.environ.get("DATA_INPUTS_DIR")
-    data_results_dir = os.environ.get("DATA_RESULTS_DIR")
-
-    if os.environ.get("ENVIRONMENT"):
-        options["environment"] = os.environ.get("ENVIRONMENT")
-    if os.environ.get("NAME"):
-        options["name"] = os.environ.get("NAME")
-    if port:
-        options["port"] = int(port)
-    if data_inputs_dir:
-        options["data_inputs_dir"] = Path(data_inputs_dir)
-    if data_results_dir:
-        options["data_results_dir"] = Path(data_results_dir)
-
-    DB_USER = os.environ.get("DB_USER")
-    DB_PASS = os.environ.get("DB_PASS")
-    DB_HOST = os.environ.get("DB_HOST")
-    DB_PORT = os.environ.get("DB_PORT")
-    DB_NAME = os.environ.get("DB_NAME")
-    if DB_USER and DB_PASS and DB_HOST and DB_PORT and DB_NAME:
+    env: Mapping[str, str] = os.environ
+    environ_options: List[Tuple[str, str, Callable[[str], Any]]] = [
+        ("environment", "ENVIRONMENT", str),
+        ("name", "NAME", str),
+        ("port", "PORT", int),
+        ("data_inputs_dir", "DATA_INPUTS_DIR", Path),
+        ("data_results_dir", "DATA_RESULTS_DIR", Path),
+    ]
+    for option_name, environ_name, option_type in environ_options:
+        value: Optional[str] = env.get(environ_name)
+        if value:
+            options[option_name] = option_type(value)
+
+    db_user, db_pass, db_host, db_port, db_name = (
+        env.get(environ_name)
+        for environ_name in (
+            "DB_USER",
+            "DB_PASS",
+            "DB_HOST",
+            "DB_PORT",
+            "DB_NAME",
+        )
+    )
+    if db_user and db_pass and db_host and db_port and db_name:
         options[
             "database_uri"
-        ] = f"mongodb://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}?authSource=admin"
+        ] = f"mongodb://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}?authSource=admin"
 
 
 def make_app() -> Tuple[MotorDatabase, tornado.web.Application]:
-    client: MotorClient = motor.motor_tornado.MotorClient(options.database_uri)
+    client: MotorClient = motor.motor_tornado.MotorClient(
+        options.database_uri,
+        maxPoolSize=constants.DATABASE_MAX_POOL_SIZE,
+        minPoolSize=constants.DATABASE_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=constants.DATABASE_SERVER_SELECTION_TIMEOUT_MS,
+        waitQueueTimeoutMS=constants.DATABASE_WAIT_QUEUE_TIMEOUT_MS,
+    )
     db: MotorDatabase = client.get_database()
     settings: Dict[str, Any] = {
         "db": db,
-        "debug": True if options.environment == "development" else False,
+        "debug": options.environment == "development",
+        "autoreload": options.autoreload,  # Not implied by debug
         "websocket_max_message_size": 5242880,  # 5 MB
     }
     return (
@@ -127,18 +157,45 @@ def make_app() -> Tuple[MotorDatabase, tornado.web.Application]:
     )
 
 
+async def flush_errors(
+    db: MotorDatabase, errors: tornado.queues.Queue
+) -> None:
+    """
+    Store queued error log records in the database in batches.
+
+    Waits for the first record, then collects more records until the batch
+    is full or the flush interval has elapsed.
+    """
+    while True:
+        batch: List[Dict[str, Any]] = [await errors.get()]
+        flush_at: float = (
+            tornado.ioloop.IOLoop.current().time()
+            + constants.DATABASE_ERRORS_FLUSH_INTERVAL
+        )
+        while len(batch) < constants.DATABASE_ERRORS_BATCH_SIZE:
+            try:
+                batch.append(await errors.get(timeout=flush_at))
+            except tornado.util.TimeoutError:
+                break
+        try:
+            await db["errors"].insert_many(batch, ordered=False)
+        except PyMongoError:
+            # Not logged with Loguru, as its errors end up in this queue
+            tornado.log.app_log.exception("Failed to store error logs")
+
+
 def set_tornado_logging() -> None:
     """
     Tornado root formatter settings.
     """
+    formatter: LogFormatter = LogFormatter(
+        fmt="%(color)s%(asctime)s.%(msecs)03dZ | %(levelname)s     | %(module)s:%(funcName)s:%(lineno)d | %(end_color)s%(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%S",
+        color=True,
+    )
+    setattr(formatter, "converter", time.gmtime)
     for handler in logging.getLogger().handlers:
         handler.setLevel(configmanager.options.loguru_level)  # type: ignore
-        formatter: LogFormatter = LogFormatter(
-            fmt="%(color)s%(asctime)s.%(msecs)03dZ | %(levelname)s     | %(module)s:%(funcName)s:%(lineno)d | %(end_color)s%(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%S",
-            color=True,
-        )
-        setattr(formatter, "converter", time.gmtime)
         handler.setFormatter(formatter)
 
 
@@ -150,24 +207,46 @@ def main() -> None:
     # Parse options
     tornado.options.parse_command_line()
 
-    # Configure Loguru logger
-    configmanager.database_sink = lambda msg: db["errors"].insert_one(
-        {"error": msg}
+    # Use environment variables to override options
+    parse_environ_options()
+
+    # Bind server sockets. In production, fork one process per CPU core, all
+    # sharing the same sockets. The application (including its database
+    # client and IOLoop) is made only after forking, as neither is fork-safe
+    sockets: List[socket.socket] = tornado.netutil.bind_sockets(options.port)
+    if options.environment != "development":
+        tornado.process.fork_processes(0)
+
+    # Make application
+    db, app = make_app()
+
+    # Configure Loguru logger. Errors may be logged from any thread, so
+    # they are handed over to the IOLoop (add_callback is thread-safe) and
+    # queued there for batched database inserts
+    io_loop: tornado.ioloop.IOLoop = tornado.ioloop.IOLoop.current()
+    errors: tornado.queues.Queue = tornado.queues.Queue()
+    configmanager.database_sink = lambda msg: io_loop.add_callback(
+        errors.put_nowait, {"error": str(msg), "ts": time.time()}
     )
+    io_loop.spawn_callback(flush_errors, db, errors)
     utils.configure_loguru_logger()
 
     # Configure other loggers
     set_tornado_logging()
-    logging.getLogger("tensorflow").setLevel(
-        logging.CRITICAL
-    )  # Suppress Tensorflow logs
-
-    # Use environment variables to override options
-    parse_environ_options()
 
-    # Make application
-    db, app = make_app()
-    app.listen(options.port)
+    # Warm up the database connection pool, so that the first request does
+    # not pay for server selection and authentication
+    try:
+        io_loop.run_sync(lambda: db.command("ping"))
+    except PyMongoError as e:
+        logger.warning("Database ping failed: {}".format(e))
+
+    server: tornado.httpserver.HTTPServer = tornado.httpserver.HTTPServer(
+        app,
+        xheaders=True,
+        max_buffer_size=10485760,  # 10 MB
+    )
+    server.add_sockets(sockets)
     logger.info(
         "Server '{}' in {} environment is listening on http://localhost:{}".format(
             options.name, options.environment, options.port
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Shared fixtures for tests.
+"""
+
+
+# ----------------------------------------------------------------------------
+# Imports
+# ----------------------------------------------------------------------------
+
+# Standard library modules
+import functools
+import pathlib
+from typing import Callable
+
+# Third-party modules
+import pytest
+
+# First-party modules
+from aim.common import image_utils
+from tests.common.constants import DATA_TESTS_INPUT_VALUES_DIR
+
+# ----------------------------------------------------------------------------
+# Metadata
+# ----------------------------------------------------------------------------
+
+__author__ = "Markku Laine"
+__date__ = "2026-10-14"
+__email__ = "markku.laine@aalto.fi"
+__version__ = "1.0"
+
+
+# ----------------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def read_gui_image() -> Callable[[str], str]:
+    """
+    Read GUI images (PNG) from the test input values directory. Each file
+    is read only once per test session.
+
+    Returns:
+        Function that takes a GUI image file name and returns the image
+        encoded in Base64
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def _read_gui_image(filename: str) -> str:
+        return image_utils.read_image(
+            pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / filename
+        )
+
+    return _read_gui_image
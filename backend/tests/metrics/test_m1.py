@@ -11,25 +11,22 @@ Tests for the 'PNG file size' metric (m1).
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import pathlib
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, List, Optional, Union
 
 # Third-party modules
 import pytest
 
 # First-party modules
-from aim.common import image_utils
 from aim.metrics.m1.m1_png_file_size import Metric
-from tests.common.constants import DATA_TESTS_INPUT_VALUES_DIR
 
 # ----------------------------------------------------------------------------
 # Metadata
 # ----------------------------------------------------------------------------
 
 __author__ = "Markku Laine"
-__date__ = "2021-12-11"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "1.1"
+__version__ = "1.2"
 
 
 # ----------------------------------------------------------------------------
@@ -46,7 +43,9 @@ __version__ = "1.1"
     ],
 )
 def test_png_file_size_desktop(
-    input_value: str, expected_results: List[Any]
+    input_value: str,
+    expected_results: List[Any],
+    read_gui_image: Callable[[str], str],
 ) -> None:
     """
     Test PNG file size (desktop GUIs).
@@ -54,14 +53,10 @@ def test_png_file_size_desktop(
     Args:
         input_value: GUI image file name
         expected_results: Expected results (list of measures)
+        read_gui_image: GUI image (PNG) reader fixture
     """
-    # Build GUI image file path
-    gui_image_filepath: pathlib.Path = (
-        pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / input_value
-    )
-
     # Read GUI image (PNG)
-    gui_image_png_base64: str = image_utils.read_image(gui_image_filepath)
+    gui_image_png_base64: str = read_gui_image(input_value)
 
     # Execute metric
     result: Optional[List[Union[int, float, str]]] = Metric.execute_metric(
@@ -11,8 +11,7 @@ Tests for the 'Color harmony' metric (m20).
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import pathlib
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, List, Optional, Union
 
 # Third-party modules
 import pytest
@@ -20,7 +19,7 @@ import pytest
 # First-party modules
 from aim.common import image_utils
 from aim.metrics.m20.m20_color_harmony import Metric
-from tests.common.constants import DATA_TESTS_INPUT_VALUES_DIR, IDIFF_TOLERANCE
+from tests.common.constants import IDIFF_TOLERANCE
 from tests.common.utils import load_expected_result
 
 # ----------------------------------------------------------------------------
@@ -28,9 +27,9 @@ from tests.common.utils import load_expected_result
 # ----------------------------------------------------------------------------
 
 __author__ = "Amir Hossein Kargaran, Markku Laine"
-__date__ = "2022-06-29"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "1.0"
+__version__ = "1.1"
 
 
 # ----------------------------------------------------------------------------
@@ -53,7 +52,9 @@ __version__ = "1.0"
     ],
 )
 def test_color_harmony_desktop(
-    input_value: str, expected_results: List[Any]
+    input_value: str,
+    expected_results: List[Any],
+    read_gui_image: Callable[[str], str],
 ) -> None:
     """
     Test Color harmony (desktop GUIs).
@@ -61,14 +62,10 @@ def test_color_harmony_desktop(
     Args:
         input_value: GUI image file name
         expected_results: Expected results (list of measures)
+        read_gui_image: GUI image (PNG) reader fixture
     """
-    # Build GUI image file path
-    gui_image_filepath: pathlib.Path = (
-        pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / input_value
-    )
-
     # Read GUI image (PNG)
-    gui_image_png_base64: str = image_utils.read_image(gui_image_filepath)
+    gui_image_png_base64: str = read_gui_image(input_value)
 
     # Execute metric
     result: Optional[List[Union[int, float, str]]] = Metric.execute_metric(
@@ -10,8 +10,7 @@ Tests for the 'UIED segmentation' metric (m25).
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import pathlib
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # Third-party modules
 import pytest
@@ -21,7 +20,7 @@ from aim.common import image_utils
 from aim.common.constants import GUI_TYPE_DESKTOP, GUI_TYPE_MOBILE
 from aim.metrics.m25.m25_uied_segmentation import Metric
 from aim.segmentation.model import Segmentation
-from tests.common.constants import DATA_TESTS_INPUT_VALUES_DIR, IDIFF_TOLERANCE
+from tests.common.constants import IDIFF_TOLERANCE
 from tests.common.utils import load_expected_result
 
 # ----------------------------------------------------------------------------
@@ -29,9 +28,9 @@ from tests.common.utils import load_expected_result
 # ----------------------------------------------------------------------------
 
 __author__ = "Amir Hossein Kargaran, Markku Laine"
-__date__ = "2022-08-05"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "1.0"
+__version__ = "1.1"
 
 
 # ----------------------------------------------------------------------------
@@ -49,7 +48,9 @@ __version__ = "1.0"
     ],
 )
 def test_uied_segmentation_desktop(
-    input_value: str, expected_results: List[Any]
+    input_value: str,
+    expected_results: List[Any],
+    read_gui_image: Callable[[str], str],
 ) -> None:
     """
     Test UIED segmentation (desktop GUIs).
@@ -57,14 +58,10 @@ def test_uied_segmentation_desktop(
     Args:
         input_value: GUI image file name
         expected_results: Expected results (list of measures)
+        read_gui_image: GUI image (PNG) reader fixture
     """
-    # Build GUI image file path
-    gui_image_filepath: pathlib.Path = (
-        pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / input_value
-    )
-
     # Read GUI image (PNG)
-    gui_image_png_base64: str = image_utils.read_image(gui_image_filepath)
+    gui_image_png_base64: str = read_gui_image(input_value)
 
     # Execute segmentation
     gui_segments: Dict[str, Any] = Segmentation.execute(
@@ -93,7 +90,9 @@ def test_uied_segmentation_desktop(
     ],
 )
 def test_uied_segmentation_mobile(
-    input_value: str, expected_results: List[Any]
+    input_value: str,
+    expected_results: List[Any],
+    read_gui_image: Callable[[str], str],
 ) -> None:
     """
     Test UIED segmentation (mobile GUIs).
@@ -101,14 +100,10 @@ def test_uied_segmentation_mobile(
     Args:
         input_value: GUI image file name
         expected_results: Expected results (list of measures)
+        read_gui_image: GUI image (PNG) reader fixture
     """
-    # Build GUI image file path
-    gui_image_filepath: pathlib.Path = (
-        pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / input_value
-    )
-
     # Read GUI image (PNG)
-    gui_image_png_base64: str = image_utils.read_image(gui_image_filepath)
+    gui_image_png_base64: str = read_gui_image(input_value)
 
     # Execute segmentation
     gui_segments: Dict[str, Any] = Segmentation.execute(
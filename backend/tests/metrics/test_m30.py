@@ -11,8 +11,7 @@ Tests for the 'MD-EAM' metric (m30).
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import pathlib
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, List, Optional, Union
 
 # Third-party modules
 import pytest
@@ -20,7 +19,7 @@ import pytest
 # First-party modules
 from aim.common import image_utils
 from aim.metrics.m30.m30_mdeam import Metric
-from tests.common.constants import DATA_TESTS_INPUT_VALUES_DIR, IDIFF_TOLERANCE
+from tests.common.constants import IDIFF_TOLERANCE
 from tests.common.utils import load_expected_result
 
 # ----------------------------------------------------------------------------
@@ -28,9 +27,9 @@ from tests.common.utils import load_expected_result
 # ----------------------------------------------------------------------------
 
 __author__ = "Markku Laine, Yao Wang"
-__date__ = "2023-06-08"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "1.0"
+__version__ = "1.1"
 
 
 # ----------------------------------------------------------------------------
@@ -65,21 +64,21 @@ __version__ = "1.0"
         ),
     ],
 )
-def test_mdeam_desktop(input_value: str, expected_results: List[Any]) -> None:
+def test_mdeam_desktop(
+    input_value: str,
+    expected_results: List[Any],
+    read_gui_image: Callable[[str], str],
+) -> None:
     """
     Test MD-EAM (desktop GUIs).
 
     Args:
         input_value: GUI image file name
         expected_results: Expected results (list of measures)
+        read_gui_image: GUI image (PNG) reader fixture
     """
-    # Build GUI image file path
-    gui_image_filepath: pathlib.Path = (
-        pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / input_value
-    )
-
     # Read GUI image (PNG)
-    gui_image_png_base64: str = image_utils.read_image(gui_image_filepath)
+    gui_image_png_base64: str = read_gui_image(input_value)
 
     # Execute metric
     result: Optional[List[Union[int, float, str]]] = Metric.execute_metric(
@@ -120,3 +119,42 @@ def test_mdeam_desktop(input_value: str, expected_results: List[Any]) -> None:
             image_utils.idiff(result[5], expected_results[5])
             <= IDIFF_TOLERANCE
         )
+
+
+def test_mdeam_desktop_batch(read_gui_image: Callable[[str], str]) -> None:
+    """
+    Test MD-EAM (desktop GUIs) executed as a single batch.
+
+    Args:
+        read_gui_image: GUI image (PNG) reader fixture
+    """
+    input_values: List[str] = [
+        "aalto.fi_website.png",
+        "myhelsinki.fi_website.png",
+    ]
+
+    # Read GUI images (PNG)
+    gui_images_png_base64: List[str] = [
+        read_gui_image(input_value) for input_value in input_values
+    ]
+
+    # Execute metric
+    results: List[
+        Optional[List[Union[int, float, str]]]
+    ] = Metric.execute_batch(gui_images_png_base64)
+
+    # Test results
+    assert len(results) == len(input_values)
+    for input_value, result in zip(input_values, results):
+        assert result is not None and len(result) == 6
+        for index, measure in enumerate(result):
+            assert isinstance(measure, str)
+            assert (
+                image_utils.idiff(
+                    measure,
+                    load_expected_result(
+                        "m30_{}_{}".format(index, input_value)
+                    ),
+                )
+                <= IDIFF_TOLERANCE
+            )
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fixtures for the model tests.
+"""
+
+
+# ----------------------------------------------------------------------------
+# Imports
+# ----------------------------------------------------------------------------
+
+# Standard library modules
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Tuple
+
+# Third-party modules
+import pytest
+
+# ----------------------------------------------------------------------------
+# Metadata
+# ----------------------------------------------------------------------------
+
+__author__ = "Markku Laine"
+__date__ = "2026-10-14"
+__email__ = "markku.laine@aalto.fi"
+__version__ = "1.0"
+
+
+# ----------------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def input_value_message_url() -> Mapping[str, Any]:
+    """
+    Input value for the message URL test.
+
+    Returns:
+        Message URL input value
+    """
+    return MappingProxyType(
+        {
+            "type": "execute",
+            "input": "url",
+            "url": "http://aalto.fi",
+            "data": None,
+            "filename": None,
+            "metrics": {
+                "cp1": False,
+                "cp2": True,
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def expected_result_message_url() -> Mapping[str, Any]:
+    """
+    Expected result for the message URL test.
+
+    Returns:
+        Message URL expected result
+    """
+    return MappingProxyType(
+        {
+            "type": "execute",
+            "input": "url",
+            "url": "http://aalto.fi",
+            "data": None,
+            "filename": None,
+            "metrics": {
+                "cp2": True,
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def gui_image_png_base64(read_gui_image: Callable[[str], str]) -> str:
+    """
+    GUI image of the message image test.
+
+    Args:
+        read_gui_image: GUI image (PNG) reader fixture
+
+    Returns:
+        GUI image (PNG) encoded in Base64
+    """
+    return read_gui_image("blue_50_red_50.png")
+
+
+@pytest.fixture(scope="session")
+def gui_image_data_url(gui_image_png_base64: str) -> str:
+    """
+    GUI image of the message image test as a data URL.
+
+    Args:
+        gui_image_png_base64: GUI image (PNG) encoded in Base64
+
+    Returns:
+        GUI image (PNG) data URL
+    """
+    return "data:image/png;base64,{}".format(gui_image_png_base64)
+
+
+@pytest.fixture(scope="session")
+def input_value_message_image(gui_image_data_url: str) -> Mapping[str, Any]:
+    """
+    Input value for the message image test.
+
+    Args:
+        gui_image_data_url: GUI image (PNG) data URL
+
+    Returns:
+        Message image input value
+    """
+    return MappingProxyType(
+        {
+            "type": "execute",
+            "input": "image",
+            "url": None,
+            "data": gui_image_data_url,
+            "filename": "blue_50_red_50.png",
+            "metrics": {
+                "cp1": False,
+                "cp2": True,
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def expected_result_message_image(
+    gui_image_png_base64: str, gui_image_data_url: str
+) -> Mapping[str, Any]:
+    """
+    Expected result for the message image test.
+
+    Args:
+        gui_image_png_base64: GUI image (PNG) encoded in Base64
+        gui_image_data_url: GUI image (PNG) data URL
+
+    Returns:
+        Message image expected result
+    """
+    return MappingProxyType(
+        {
+            "type": "execute",
+            "input": "image",
+            "url": None,
+            "data": gui_image_data_url,
+            "filename": "blue_50_red_50.png",
+            "metrics": {
+                "cp2": True,
+            },
+            "raw_data": gui_image_png_base64,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def input_value_message_invalid() -> Mapping[str, Any]:
+    """
+    Input value for the invalid message test.
+
+    Returns:
+        Invalid message input value
+    """
+    return MappingProxyType(
+        {
+            "type": "execute",
+            "url": None,
+            "data": None,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def expected_result_message_invalid() -> Tuple[Mapping[str, Any], ...]:
+    """
+    Expected result for the invalid message test. The errors are sorted by
+    location, as their order is not part of the tested behavior.
+
+    Returns:
+        Invalid message expected result (validation errors)
+    """
+    return tuple(
+        sorted(
+            [
+                MappingProxyType(
+                    {
+                        "loc": ("input",),
+                        "msg": "field required",
+                        "type": "value_error.missing",
+                    }
+                ),
+                MappingProxyType(
+                    {
+                        "loc": ("data",),
+                        "msg": "none is not an allowed value",
+                        "type": "type_error.none.not_allowed",
+                    }
+                ),
+                MappingProxyType(
+                    {
+                        "loc": ("filename",),
+                        "msg": "field required",
+                        "type": "value_error.missing",
+                    }
+                ),
+                MappingProxyType(
+                    {
+                        "loc": ("metrics",),
+                        "msg": "field required",
+                        "type": "value_error.missing",
+                    }
+                ),
+            ],
+            key=lambda error: error["loc"],
+        )
+    )
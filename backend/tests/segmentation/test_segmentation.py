@@ -10,26 +10,23 @@ Tests for the 'Segmentation'.
 # ----------------------------------------------------------------------------
 
 # Standard library modules
-import pathlib
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 # Third-party modules
 import pytest
 
 # First-party modules
-from aim.common import image_utils
 from aim.common.constants import GUI_TYPE_DESKTOP, GUI_TYPE_MOBILE
 from aim.segmentation.model import Segmentation
-from tests.common.constants import DATA_TESTS_INPUT_VALUES_DIR
 
 # ----------------------------------------------------------------------------
 # Metadata
 # ----------------------------------------------------------------------------
 
 __author__ = "Amir Hossein Kargaran, Markku Laine"
-__date__ = "2022-08-05"
+__date__ = "2026-10-14"
 __email__ = "markku.laine@aalto.fi"
-__version__ = "1.0"
+__version__ = "1.1"
 
 
 # ----------------------------------------------------------------------------
@@ -44,20 +41,18 @@ __version__ = "1.0"
         (["black.png"]),
     ],
 )
-def test_segmentation_desktop(input_value: str) -> None:
+def test_segmentation_desktop(
+    input_value: str, read_gui_image: Callable[[str], str]
+) -> None:
     """
     Test Segmentation (desktop GUIs).
 
     Args:
         input_value: GUI image file name
+        read_gui_image: GUI image (PNG) reader fixture
     """
-    # Build GUI image file path
-    gui_image_filepath: pathlib.Path = (
-        pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / input_value
-    )
-
     # Read GUI image (PNG)
-    gui_image_png_base64: str = image_utils.read_image(gui_image_filepath)
+    gui_image_png_base64: str = read_gui_image(input_value)
 
     # Execute segmentation
     result: Dict[str, Any] = Segmentation.execute(
@@ -77,20 +72,18 @@ def test_segmentation_desktop(input_value: str) -> None:
         (["uied_mobile.png"]),
     ],
 )
-def test_segmentation_mobile(input_value: str) -> None:
+def test_segmentation_mobile(
+    input_value: str, read_gui_image: Callable[[str], str]
+) -> None:
     """
     Test Segmentation (desktop GUIs).
 
     Args:
         input_value: GUI image file name
+        read_gui_image: GUI image (PNG) reader fixture
     """
-    # Build GUI image file path
-    gui_image_filepath: pathlib.Path = (
-        pathlib.Path(DATA_TESTS_INPUT_VALUES_DIR) / input_value
-    )
-
     # Read GUI image (PNG)
-    gui_image_png_base64: str = image_utils.read_image(gui_image_filepath)
+    gui_image_png_base64: str = read_gui_image(input_value)
 
     # Execute segmentation
     result: Dict[str, Any] = Segmentation.execute(